@@ -1,9 +1,24 @@
-from decimal import Decimal, getcontext
 import math
-from main import main, PI
+from main import build_bodies
 
-# Set precision to 50 decimal places
-getcontext().prec = 50
+def _hohmann_phase_angle_f64(r1: float, r2: float, mu: float) -> float:
+    """Phase angle in radians for a Hohmann transfer between circular orbits.
+    
+    Args:
+        r1: Radius of the inner orbit in meters
+        r2: Radius of the outer orbit in meters
+        mu: Gravitational parameter of the shared parent body (m³/s²)
+    """
+    # Calculate transfer time (half orbit of transfer ellipse)
+    a = 0.5 * (r1 + r2)  # semi-major axis of transfer orbit
+    transfer_time = math.pi * math.sqrt(a * a * a / mu)
+    
+    # Angular velocity of the outer orbit (radians per second)
+    w2 = math.sqrt(mu / (r2 * r2 * r2))
+    
+    # During transfer time, outer body moves: w2 * transfer_time radians
+    # We want inner body to move exactly 180° (π radians) more than this
+    return math.pi - w2 * transfer_time
 
 def calculate_hohmann_phase_angle(body1, body2):
     """Calculate the phase angle needed for a Hohmann transfer between two bodies.
@@ -17,35 +32,23 @@ def calculate_hohmann_phase_angle(body1, body2):
         raise ValueError("Bodies must share the same parent body")
     
     # Get orbital radii in meters
-    r1 = body1.distance_from_parent_km * Decimal('1000')
-    r2 = body2.distance_from_parent_km * Decimal('1000')
+    r1 = body1.orbit_radius_m
+    r2 = body2.orbit_radius_m
     
     # Ensure r1 is the smaller orbit
     if r1 > r2:
         r1, r2 = r2, r1
     
-    # Calculate transfer time (half orbit of transfer ellipse)
-    mu = body1.parent_body.G * body1.parent_body.mass  # gravitational parameter
-    a = (r1 + r2) / Decimal('2')  # semi-major axis of transfer orbit
-    transfer_time = PI * (a * a * a / mu).sqrt()
-    
-    # Calculate angular velocities (radians per second)
-    w1 = (mu / (r1 * r1 * r1)).sqrt()  # angular velocity of inner orbit
-    w2 = (mu / (r2 * r2 * r2)).sqrt()  # angular velocity of outer orbit
-    
-    # Calculate phase angle
-    # During transfer time, outer body moves: w2 * transfer_time radians
-    # We want inner body to move exactly 180° (π radians) more than this
-    phase_angle = float(PI - w2 * transfer_time)
-    
-    return phase_angle
+    mu = body1.parent_body.mu  # gravitational parameter
+    return _hohmann_phase_angle_f64(r1, r2, mu)
 
 def main_hohmann():
-    bodies = main()
+    bodies = build_bodies()
+    by_name = {b.name: b for b in bodies}
     
-    # Find Phobos and Deimos
-    cb1 = next(b for b in bodies if b.name == "Mars")
-    cb2 = next(b for b in bodies if b.name == "Earth")
+    # Find the transfer bodies
+    cb1 = by_name["Mars"]
+    cb2 = by_name["Earth"]
     
     # Calculate phase angle for transfer
     phase_angle = calculate_hohmann_phase_angle(cb1, cb2)
@@ -1,6 +1,5 @@
 import pygame
 import sys
-from decimal import Decimal
 from main import CelestialBody, main
 import math
 
@@ -12,6 +11,28 @@ WINDOW_SIZE = (1200, 800)
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 FONT_SIZE = 16
+TANGENT_HALF_LENGTH = 600  # Half the 1200 px line drawn along very large orbits
+TEXT_CACHE_SIZE = 512  # Rendered text surfaces kept before the oldest are dropped
+ZOOM_BASE = 2e-10  # Zoom at zoom_level 0, in pixels per meter
+ZOOM_STEP = 1.2  # Zoom factor per mouse wheel step
+ZOOM_LEVEL_RANGE = (-1000, 1000)  # Levels where the float zoom stays finite and non-zero
+TIME_SCALE_STEP = 10.0
+TIME_SCALE_EXPONENT_RANGE = (-12, 12)  # Time scale runs from 1e-12x to 1e12x
+# Window events after which the last drawn frame may no longer be on screen
+REPAINT_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN, pygame.WINDOWRESTORED)
+
+def zoom_for_level(zoom_level: int) -> float:
+    """Zoom in pixels per meter at a zoom level"""
+    return ZOOM_BASE * ZOOM_STEP ** zoom_level
+
+def orbit_depth(body: CelestialBody) -> int:
+    """Number of parents above a body (0 for the sun)"""
+    depth = 0
+    current = body.parent_body
+    while current:
+        depth += 1
+        current = current.parent_body
+    return depth
 
 class Visualizer:
     def __init__(self, bodies):
@@ -19,31 +40,75 @@ class Visualizer:
         pygame.display.set_caption("Solar System Visualizer")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, FONT_SIZE)
+        self._text_cache: dict[str, pygame.Surface] = {}  # Rendered labels keyed by their text
         
         self.bodies = bodies
         self.camera_x = 0
         self.camera_y = 0
         self.zoom_level = 0  # Base zoom level
-        self.zoom = Decimal('2e-10') * Decimal('1.2') ** self.zoom_level  # Initial zoom
+        self.zoom = zoom_for_level(self.zoom_level)  # Initial zoom
         self.dragging = False
         self.last_mouse_pos = None
         self.hovered_body = None
+        self._pending_hover_pos = None  # Latest mouse position not yet hit-tested
         
         # Time control
-        self.time_scale = Decimal('1')  # 1 second real time = 1 second simulation time
+        # Time scale is TIME_SCALE_STEP ** exponent; keeping the exponent as an int
+        # lets any number of speed-ups and slow-downs cancel exactly
+        self._time_scale_exponent = 0
+        self.time_scale = 1.0  # 1 second real time = 1 second simulation time
         self.paused = False
         
-    def world_to_screen(self, x: Decimal, y: Decimal) -> tuple[int, int]:
+        # Key presses handled by run(); ESC is handled together with QUIT
+        self._key_handlers = {
+            pygame.K_SPACE: self.toggle_pause,
+            pygame.K_PLUS: self.speed_up,
+            pygame.K_EQUALS: self.speed_up,  # Unshifted '+' key
+            pygame.K_KP_PLUS: self.speed_up,
+            pygame.K_UP: self.speed_up,
+            pygame.K_MINUS: self.slow_down,
+            pygame.K_KP_MINUS: self.slow_down,
+            pygame.K_DOWN: self.slow_down,
+        }
+        
+        # Set whenever the picture changes; run() skips drawing frames where it is clear
+        self._needs_redraw = True
+        
+        # Circular-orbit angular velocity (radians per second) of every body that orbits something.
+        # It depends only on the parent's mass and the orbit radius, so it is computed once here.
+        self._angular_velocities: list[tuple[CelestialBody, float]] = []
+        for body in bodies:
+            if body.parent_body:
+                r = body.orbit_radius_m
+                self._angular_velocities.append((body, math.sqrt(body.parent_body.mu / (r * r * r))))
+        
+        # Bodies sorted parents-first, so absolute positions can be filled in a single pass
+        self._position_order = sorted(bodies, key=orbit_depth)
+        
+        # Absolute body positions for the current frame, refreshed after each orbit update
+        self._absolute_positions: dict[CelestialBody, tuple[float, float]] = {}
+        self.update_absolute_positions()
+        
+        # Screen positions from the last drawn frame, reused by the hover test
+        self._screen_positions: dict[CelestialBody, tuple[int, int]] = {}
+        
+    def world_to_screen(self, x: float, y: float) -> tuple[int, int]:
         """Convert world coordinates (meters) to screen coordinates (pixels)"""
-        screen_x = int(float(x * self.zoom)) + WINDOW_SIZE[0]//2 + self.camera_x
-        screen_y = int(float(y * self.zoom)) + WINDOW_SIZE[1]//2 + self.camera_y
+        zoom = self.zoom
+        screen_x = int(x * zoom) + WINDOW_SIZE[0]//2 + self.camera_x
+        screen_y = int(y * zoom) + WINDOW_SIZE[1]//2 + self.camera_y
         return (screen_x, screen_y)
         
-    def screen_to_world(self, screen_x: int, screen_y: int) -> tuple[Decimal, Decimal]:
-        """Convert screen coordinates (pixels) to world coordinates (meters)"""
-        world_x = (Decimal(str(screen_x - WINDOW_SIZE[0]//2 - self.camera_x)) / self.zoom)
-        world_y = (Decimal(str(screen_y - WINDOW_SIZE[1]//2 - self.camera_y)) / self.zoom)
-        return (world_x, world_y)
+    def render_text(self, text: str) -> pygame.Surface:
+        """Render a line of white text, reusing the surface from earlier frames"""
+        surface = self._text_cache.get(text)
+        if surface is None:
+            surface = self.font.render(text, True, WHITE)
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest entry
+                del self._text_cache[next(iter(self._text_cache))]
+            self._text_cache[text] = surface
+        return surface
     
     def draw_controls(self):
         """Draw control instructions"""
@@ -54,16 +119,16 @@ class Visualizer:
             "Hover: Show body info",
             "Space: Pause/Resume",
             "+ / -: Speed up/slow down time (10x)",
-            f"Time scale: {float(self.time_scale):.1e}x",
+            f"Time scale: {self.time_scale:.1e}x",
             "ESC: Quit"
         ]
         y = 10
         for line in controls:
-            text = self.font.render(line, True, WHITE)
+            text = self.render_text(line)
             self.screen.blit(text, (10, y))
             y += FONT_SIZE + 2
     
-    def get_absolute_position(self, body: CelestialBody) -> tuple[Decimal, Decimal]:
+    def get_absolute_position(self, body: CelestialBody) -> tuple[float, float]:
         """Get position relative to the sun (0,0) by accumulating parent positions"""
         x, y = body.get_position()
         current = body.parent_body
@@ -74,21 +139,42 @@ class Visualizer:
             current = current.parent_body
         return (x, y)
     
+    def update_absolute_positions(self):
+        """Recompute the absolute position of every body in one pass.
+        Bodies are visited parents-first, so a parent's position is already
+        known when its children need it."""
+        positions = {}
+        for body in self._position_order:
+            x, y = body.get_position()
+            parent = body.parent_body
+            if parent:
+                parent_position = positions.get(parent)
+                if parent_position is None:
+                    # The parent is not in this visualizer's body list; resolve it once and
+                    # keep it so draw_body can still centre the orbit on it
+                    parent_position = self.get_absolute_position(parent)
+                    positions[parent] = parent_position
+                parent_x, parent_y = parent_position
+                x += parent_x
+                y += parent_y
+            positions[body] = (x, y)
+        self._absolute_positions = positions
+    
     def draw_body(self, body: CelestialBody):
         """Draw a celestial body and its orbit"""
         # Get absolute position
-        x, y = self.get_absolute_position(body)
+        x, y = self._absolute_positions[body]
         screen_x, screen_y = self.world_to_screen(x, y)
+        self._screen_positions[body] = (screen_x, screen_y)
         
         # Calculate radius in pixels (minimum 2 pixels, no maximum)
-        radius_m = body.radius * Decimal('1000')
-        radius_px = max(2, int(float(radius_m * self.zoom)))
+        radius_px = max(2, int(body.radius_m * self.zoom))
         
         # Draw orbit circle/arc if body has a parent
         if body.parent_body:
-            parent_x, parent_y = self.get_absolute_position(body.parent_body)
+            parent_x, parent_y = self._absolute_positions[body.parent_body]
             parent_screen_x, parent_screen_y = self.world_to_screen(parent_x, parent_y)
-            orbit_radius = int(float(body.distance_from_parent_km * 1000 * self.zoom))
+            orbit_radius = int(body.orbit_radius_m * self.zoom)
             
             # Only draw orbit if parent is near screen and orbit is visible
             if (0 < orbit_radius and
@@ -100,21 +186,23 @@ class Visualizer:
                     pygame.draw.circle(self.screen, (50, 50, 50), 
                                      (parent_screen_x, parent_screen_y), 
                                      orbit_radius, 1)
-                else:
-                    # For large orbits, draw a line segment tangent to the orbit
-                    # Calculate angle to current position relative to parent
+                elif (-TANGENT_HALF_LENGTH <= screen_x <= WINDOW_SIZE[0] + TANGENT_HALF_LENGTH and
+                      -TANGENT_HALF_LENGTH <= screen_y <= WINDOW_SIZE[1] + TANGENT_HALF_LENGTH):
+                    # For large orbits, draw a line segment tangent to the orbit.
+                    # Every point of it lies within half its length of the body,
+                    # so bodies farther off-screen than that are skipped above.
+                    # Radius vector from the parent to the body
                     dx = screen_x - parent_screen_x
                     dy = screen_y - parent_screen_y
-                    current_angle = math.atan2(dy, dx)
                     
-                    # Calculate points for line segment perpendicular to radius
-                    # Use a fixed length of 1200 pixels for the line
-                    line_length = 1200
-                    tangent_angle = current_angle + math.pi/2  # 90 degrees offset for tangent
-                    start_x = screen_x - math.cos(tangent_angle) * line_length/2
-                    start_y = screen_y - math.sin(tangent_angle) * line_length/2
-                    end_x = screen_x + math.cos(tangent_angle) * line_length/2
-                    end_y = screen_y + math.sin(tangent_angle) * line_length/2
+                    # The tangent is the radius rotated 90 degrees: (-dy, dx), scaled to half the line
+                    scale = TANGENT_HALF_LENGTH / (math.hypot(dx, dy) or 1.0)
+                    tangent_x = -dy * scale
+                    tangent_y = dx * scale
+                    start_x = screen_x - tangent_x
+                    start_y = screen_y - tangent_y
+                    end_x = screen_x + tangent_x
+                    end_y = screen_y + tangent_y
                     
                     pygame.draw.line(self.screen, (50, 50, 50),
                                    (int(start_x), int(start_y)),
@@ -127,7 +215,7 @@ class Visualizer:
             
             # Draw name if zoomed in enough or if body is hovered
             if radius_px > 5 or body == self.hovered_body:
-                name_text = self.font.render(body.name, True, WHITE)
+                name_text = self.render_text(body.name)
                 self.screen.blit(name_text, (screen_x + radius_px + 5, screen_y - 8))
             
             # Draw info box if body is hovered
@@ -136,15 +224,15 @@ class Visualizer:
                     f"Mass: {body.mass:.2e} kg",
                     f"Radius: {body.radius:.1f} km",
                     f"Surface Gravity: {body.surface_gravity:.1f} m/s²",
-                    f"Escape Velocity: {body.escape_velocity/Decimal('1000'):.1f} km/s"
+                    f"Escape Velocity: {body.escape_velocity * 1e-3:.1f} km/s"
                 ]
                 if body.parent_body:
                     info.append(f"Distance from {body.parent_body.name}: {body.distance_from_parent_km:,.0f} km")
-                    info.append(f"Orbital Velocity: {body.current_orbital_velocity/Decimal('1000'):.1f} km/s")
+                    info.append(f"Orbital Velocity: {body.current_orbital_velocity * 1e-3:.1f} km/s")
                 
                 y_offset = screen_y + radius_px + 5
                 for line in info:
-                    text = self.font.render(line, True, WHITE)
+                    text = self.render_text(line)
                     self.screen.blit(text, (screen_x + radius_px + 5, y_offset))
                     y_offset += FONT_SIZE + 2
     
@@ -153,77 +241,91 @@ class Visualizer:
         Shows info if mouse is within 5 pixels of center or within the body's radius."""
         mouse_x, mouse_y = mouse_pos
         closest_body = None
-        closest_distance_px = float('inf')
+        closest_distance_sq = float('inf')
         
-        for body in self.bodies:
-            # Get screen position of body
-            body_x, body_y = self.get_absolute_position(body)
-            screen_x, screen_y = self.world_to_screen(body_x, body_y)
-            
-            # Calculate radius in pixels
-            radius_m = body.radius * Decimal('1000')
-            radius_px = max(2, int(float(radius_m * self.zoom)))
-            
-            # Calculate distance in pixels
+        if self._needs_redraw:
+            # The view changed since the last draw, so project every body again
+            screen_positions = {body: self.world_to_screen(*self._absolute_positions[body])
+                                for body in self.bodies}
+        else:
+            # Nothing moved since the last draw, so its projections are still current
+            screen_positions = self._screen_positions
+        
+        for body, (screen_x, screen_y) in screen_positions.items():
+            # Squared distance in pixels; the ordering is the same without the sqrt
             dx = screen_x - mouse_x
             dy = screen_y - mouse_y
-            distance_px = (dx * dx + dy * dy) ** 0.5
+            distance_sq = dx * dx + dy * dy
             
             # Update closest body if this one is closer
-            if distance_px < closest_distance_px:
-                closest_distance_px = distance_px
+            if distance_sq < closest_distance_sq:
+                closest_distance_sq = distance_sq
                 closest_body = body
         
         # Return closest body if within 5 pixels of center or within body's radius
         if closest_body:
-            radius_m = closest_body.radius * Decimal('1000')
-            radius_px = max(2, int(float(radius_m * self.zoom)))
-            return closest_body if closest_distance_px <= max(5, radius_px) else None
+            radius_px = max(2, int(closest_body.radius_m * self.zoom))
+            hover_px = max(5, radius_px)
+            return closest_body if closest_distance_sq <= hover_px * hover_px else None
         return None
     
     def adjust_zoom(self, steps: int):
         """Adjust zoom by a number of steps (positive = zoom in, negative = zoom out)
         Each step is a 20% change"""
         mouse_x, mouse_y = pygame.mouse.get_pos()
-        world_x, world_y = self.screen_to_world(mouse_x, mouse_y)
+        old_zoom = self.zoom
         
-        self.zoom_level += steps
-        self.zoom = Decimal('2e-10') * Decimal('1.2') ** self.zoom_level
+        min_level, max_level = ZOOM_LEVEL_RANGE
+        self.zoom_level = min(max(self.zoom_level + steps, min_level), max_level)
+        self.zoom = zoom_for_level(self.zoom_level)
         
-        # Adjust camera to keep mouse position fixed
-        new_screen_x = int(float(world_x * self.zoom)) + WINDOW_SIZE[0]//2 + self.camera_x
-        new_screen_y = int(float(world_y * self.zoom)) + WINDOW_SIZE[1]//2 + self.camera_y
-        self.camera_x += mouse_x - new_screen_x
-        self.camera_y += mouse_y - new_screen_y
+        # Adjust camera to keep mouse position fixed: the mouse's offset from the
+        # projected origin scales with the zoom, so solve for the new camera directly
+        ratio = self.zoom / old_zoom
+        offset_x = mouse_x - WINDOW_SIZE[0]//2 - self.camera_x
+        offset_y = mouse_y - WINDOW_SIZE[1]//2 - self.camera_y
+        self.camera_x = mouse_x - WINDOW_SIZE[0]//2 - int(offset_x * ratio)
+        self.camera_y = mouse_y - WINDOW_SIZE[1]//2 - int(offset_y * ratio)
+        self._needs_redraw = True
     
     def update_orbits(self, dt_seconds: float):
         """Update orbital positions based on time elapsed"""
         if self.paused:
             return
             
-        dt = Decimal(str(dt_seconds)) * self.time_scale
+        dt = dt_seconds * self.time_scale
         
-        for body in self.bodies:
-            if body.parent_body:  # Only update bodies that orbit something
-                # Calculate angular velocity (radians per second)
-                mu = body.parent_body.G * body.parent_body.mass
-                r = body.distance_from_parent_km * Decimal('1000')  # Convert to meters
-                angular_velocity = (mu / (r * r * r)).sqrt()
-                
-                # Update orbit angle
-                angle_change = angular_velocity * dt
-                new_angle = body._orbit_angle + angle_change
-                body.update_position(new_angle)
+        for body, angular_velocity in self._angular_velocities:
+            # Update orbit angle
+            angle_change = angular_velocity * dt
+            new_angle = body._orbit_angle + angle_change
+            body.update_position(new_angle)
+        
+        self.update_absolute_positions()
+        self._needs_redraw = True
+    
+    def toggle_pause(self):
+        """Stop or resume the orbital motion"""
+        self.paused = not self.paused
+    
+    def speed_up(self):
+        """Make simulated time run 10x faster"""
+        self._set_time_scale_exponent(self._time_scale_exponent + 1)
+    
+    def slow_down(self):
+        """Make simulated time run 10x slower"""
+        self._set_time_scale_exponent(self._time_scale_exponent - 1)
+    
+    def _set_time_scale_exponent(self, exponent: int):
+        min_exponent, max_exponent = TIME_SCALE_EXPONENT_RANGE
+        self._time_scale_exponent = min(max(exponent, min_exponent), max_exponent)
+        self.time_scale = TIME_SCALE_STEP ** self._time_scale_exponent
     
     def run(self):
         running = True
-        last_time = pygame.time.get_ticks() / 1000.0  # Convert to seconds
+        dt = 0.0  # Seconds elapsed during the previous frame
         
         while running:
-            current_time = pygame.time.get_ticks() / 1000.0
-            dt = current_time - last_time
-            last_time = current_time
-            
             for event in pygame.event.get():
                 if event.type == pygame.QUIT or (
                     event.type == pygame.KEYDOWN and 
@@ -252,34 +354,46 @@ class Visualizer:
                         self.camera_x += dx
                         self.camera_y += dy
                         self.last_mouse_pos = current_pos
+                        self._needs_redraw = True
                     
-                    # Update hovered body
-                    self.hovered_body = self.find_hovered_body(event.pos)
+                    # Hover is resolved once per frame, after all events are drained
+                    self._pending_hover_pos = event.pos
+                
+                elif event.type in REPAINT_EVENTS:
+                    self._needs_redraw = True
                 
                 elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        self.paused = not self.paused
-                    elif event.key == pygame.K_UP or event.key == pygame.K_UP:
-                        self.time_scale *= Decimal('10')
-                    elif event.key == pygame.K_DOWN or event.key == pygame.K_DOWN:
-                        self.time_scale /= Decimal('10')
+                    handler = self._key_handlers.get(event.key)
+                    if handler:
+                        handler()
+                        self._needs_redraw = True
+            
+            # Update hovered body from the last mouse position seen this frame
+            if self._pending_hover_pos is not None:
+                hovered_body = self.find_hovered_body(self._pending_hover_pos)
+                self._pending_hover_pos = None
+                if hovered_body is not self.hovered_body:
+                    self.hovered_body = hovered_body
+                    self._needs_redraw = True
             
             # Update orbital positions
             self.update_orbits(dt)
             
-            # Clear screen
-            self.screen.fill(BLACK)
-            
-            # Draw all bodies
-            for body in self.bodies:
-                self.draw_body(body)
-            
-            # Draw controls
-            self.draw_controls()
-            
-            # Update display
-            pygame.display.flip()
-            self.clock.tick(60)
+            if self._needs_redraw:
+                # Clear screen
+                self.screen.fill(BLACK)
+                
+                # Draw all bodies
+                for body in self.bodies:
+                    self.draw_body(body)
+                
+                # Draw controls
+                self.draw_controls()
+                
+                # Update display
+                pygame.display.flip()
+                self._needs_redraw = False
+            dt = self.clock.tick(60) * 1e-3  # Milliseconds since the last tick, in seconds
         
         pygame.quit()
 